@@ -23,18 +23,17 @@ def get_argparser():
 
 
 def remove_error_handling(graph, exception_subprocess_name):
-    boundary_events = graph.get_child_nodes_with_tag(str(Tag('boundaryEvent')))
-    event_ids = [event.id for event in boundary_events]
+    boundary_events = graph.get_child_nodes_with_tag(Tag.clark('boundaryEvent'))
+    id_set = {event.id for event in boundary_events}
 
     exception_subprocesses = [subprocess for subprocess in graph if
                               isinstance(subprocess, Subprocess) and subprocess.name == exception_subprocess_name]
     sp_ids = [sp.id for sp in exception_subprocesses]
-    downstream = [graph.get_downstream_nodes(sp_id) for sp_id in sp_ids]
 
-    event_ids.extend(sp_ids)
-    event_ids.extend(itertools.chain(*downstream))
+    id_set.update(sp_ids)
+    id_set.update(itertools.chain.from_iterable(graph.get_downstream_nodes(sp_id) for sp_id in sp_ids))
 
-    return graph.remove_adjacent(event_ids)
+    return graph.remove_adjacent(id_set)
 
 
 def main():
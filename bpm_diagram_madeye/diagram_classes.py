@@ -1,69 +1,48 @@
 import re
-from functools import partial
+from collections import defaultdict
+from functools import lru_cache
 
 from lxml import etree
 
 
 def handle_subProcess(element):
-    if Graph.element_is_subprocess(element):
-        return Subprocess.from_element(element)
-    else:
-        raise UnsuitableHandlerException
+    return Subprocess.from_element(element)
 
 
 def handle_boundaryEvent(element):
-    if element.tag == str(Tag('boundaryEvent')):
-        return BoundaryEvent.from_element(element)
-    else:
-        raise UnsuitableHandlerException
+    return BoundaryEvent.from_element(element)
 
 
 def handle_serviceTask(element):
-    if element.tag == str(Tag('serviceTask')):
-        return ServiceTask.from_element(element)
-    else:
-        raise UnsuitableHandlerException
+    return ServiceTask.from_element(element)
 
 
 def handle_userTask(element):
-    if element.tag == str(Tag('userTask')):
-        return UserTask.from_element(element)
-    else:
-        raise UnsuitableHandlerException
+    return UserTask.from_element(element)
 
 
 def handle_callActivity(element):
-    if element.tag == str(Tag('callActivity')):
-        return CallActivity.from_element(element)
-    else:
-        raise UnsuitableHandlerException
+    return CallActivity.from_element(element)
 
 
 def handle_intermediateCatchEvent(element):
-    if element.tag == str(Tag('intermediateCatchEvent')):
-        return IntermediateCatchEvent.from_element(element)
-    else:
-        raise UnsuitableHandlerException
+    return IntermediateCatchEvent.from_element(element)
 
 
-def handle_coloured_node(colour, element):
-    node = handle_node(element)
-    node.colour = colour
-    return node
+def handle_startEvent(element):
+    return StartEvent.from_element(element)
+
+
+def handle_endEvent(element):
+    return EndEvent.from_element(element)
 
 
 def handle_node(element):
-    if Graph.element_has_attribs(element, ['id']):
-        return Node.from_element(element)
-    else:
-        raise UnsuitableHandlerException
+    return Node.from_element(element)
 
 
 def handle_edge(element):
-    if Graph.element_has_attribs(element, ['id', 'sourceRef', 'targetRef']):
-        return Edge.from_element(element)
-    else:
-        raise UnsuitableHandlerException
+    return Edge.from_element(element)
 
 
 def handle_gateway(element):
@@ -74,11 +53,8 @@ class BpmDiagramException(Exception):
     pass
 
 
-class UnsuitableHandlerException(BpmDiagramException):
-    pass
-
-
 class Tag:
+    __slots__ = ('namespace', 'tag')
     BPMN_NAMESPACE = 'http://www.omg.org/spec/BPMN/20100524/MODEL'
     __TAG_REGEX = re.compile("^{(.*)}(.*)$")
 
@@ -86,14 +62,24 @@ class Tag:
         self.namespace = namespace
         self.tag = tag
 
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def clark(tag, namespace=BPMN_NAMESPACE):
+        return f'{{{namespace}}}{tag}'
+
     @classmethod
     def from_string(cls, tag_str):
-        regex_result = Tag.__TAG_REGEX.match(tag_str)
-        namespace = regex_result.group(1)
-        tagname = regex_result.group(2)
+        namespace, tagname = Tag.__parse(tag_str)
 
         return Tag(tagname, namespace=namespace)
 
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def __parse(tag_str):
+        regex_result = Tag.__TAG_REGEX.match(tag_str)
+
+        return regex_result.group(1), regex_result.group(2)
+
     @classmethod
     def from_element(cls, element):
         return Tag.from_string(element.tag)
@@ -102,6 +88,11 @@ class Tag:
         return f'{{{self.namespace}}}{self.tag}'
 
 
+_TASK_LISTENER_XPATH = etree.XPath('.//a:taskListener', namespaces={'a': 'http://activiti.org/bpmn'})
+_MSG_EVT_PATH = f'.//{Tag.clark("messageEventDefinition")}'
+_TIMER_PATH = f'.//{Tag.clark("timeDuration")}'
+
+
 class Graph:
     DOT_HEADERS = [
         'fontname = "sans"',
@@ -109,20 +100,9 @@ class Graph:
         'edge[fontname = "sans"]'
     ]
 
-    OTHER_HANDLERS = [
-        handle_edge,
-        handle_node
-    ]
-
-    TAG_HANDLERS = {
-        'exclusiveGateway': handle_gateway,
-        'parallelGateway': handle_gateway,
-        'startEvent': partial(handle_coloured_node, '#d1ffd1'),
-        'endEvent': partial(handle_coloured_node, '#ffd1d1')
-    }
-
     def __init__(self, root=None):
         self.__graph = {}
+        self.__clear_indexes()
 
         if root is not None:
             for element in root:
@@ -133,28 +113,76 @@ class Graph:
         self.__add_item(item)
 
     def to_dot(self, graph=None, params=None):
-        return '\n'.join([item.to_dot(graph=graph, params=params) for item in self.__graph.values()])
+        result = []
+        self.write_dot(result.append, graph=graph, params=params)
+
+        return ''.join(result)
+
+    def write_dot(self, write, graph=None, params=None):
+        for item in self.__graph.values():
+            item.write_dot(write, graph=graph, params=params)
+            write('\n')
 
     def __add_item(self, item):
         if item:
-            self.__graph[item.id] = item
+            if item.id in self.__graph:
+                # A repeated id keeps its original slot in the dict, so rebuild the indexes to follow that order
+                self.__graph[item.id] = item
+                self.__clear_indexes()
+                for existing in self.__graph.values():
+                    self.__index_item(existing)
+            else:
+                self.__graph[item.id] = item
+                self.__index_item(item)
+
+    def __clear_indexes(self):
+        self.__edges = []
+        self.__edges_by_source = defaultdict(list)
+        self.__edges_by_target = defaultdict(list)
+        self.__nodes = []
+        self.__nodes_by_tag = defaultdict(list)
+
+    def __index_item(self, item):
+        if isinstance(item, Edge):
+            self.__edges.append(item)
+            self.__edges_by_source[item.source_node].append(item)
+            self.__edges_by_target[item.target_node].append(item)
+        elif isinstance(item, Node):
+            self.__nodes.append(item)
+            self.__nodes_by_tag[item.tag].append(item)
 
     def save(self, output_file, params):
         with open(output_file, 'w') as file:
-            file.write('digraph G {\n')
+            write = file.write
+            write('digraph G {\n')
 
             for header in Graph.DOT_HEADERS:
-                file.write(header)
-                file.write('\n')
+                write(header)
+                write('\n')
 
-            file.write(self.to_dot(graph=self.__graph, params=params))
+            self.write_dot(write, graph=self.__graph, params=params)
 
-            file.write('}\n')
+            write('}\n')
 
     @classmethod
     def load(cls, input_file):
-        bpm_data = etree.parse(input_file)
-        process_elements = bpm_data.xpath('//bpm:process', namespaces={'bpm': Tag.BPMN_NAMESPACE})
+        process_tag = Tag.clark('process')
+        process_elements = []
+        in_process = False
+        for event, element in etree.iterparse(input_file, events=('start', 'end')):
+            if element.tag == process_tag:
+                in_process = event == 'start'
+                if not in_process:
+                    process_elements.append(element)
+            elif event == 'end' and not in_process:
+                parent = element.getparent()
+                if parent is None:
+                    continue
+                element.clear(keep_tail=True)
+                # Top-level siblings are kept as a process element may be among them
+                if parent.getparent() is not None:
+                    while element.getprevious() is not None:
+                        del parent[0]
 
         if len(process_elements) != 1:
             raise RuntimeError(f"{len(process_elements)} process elements found - 1 expected")
@@ -162,35 +190,32 @@ class Graph:
         return Graph(process_elements[0])
 
     def get_child_nodes(self):
-        child_nodes = [child for child in self.__graph.values() if isinstance(child, Node)]
-
-        return child_nodes
+        return list(self.__nodes)
 
     def get_first_node(self):
-        return self.get_child_nodes()[0]
+        return self.__nodes[0]
 
     def get_last_node(self):
-        return self.get_child_nodes()[-1]
+        return self.__nodes[-1]
 
     def get_child_nodes_with_tag(self, tag):
-        return [node for node in self.get_child_nodes() if node.tag == tag]
+        return list(self.__nodes_by_tag.get(tag, ()))
 
     def get_item(self, item_id):
         return self.__graph.get(item_id)
 
     def remove_adjacent(self, id_list):
         result = Graph()
-        id_set = set(id_list)
-        for _, item in self.__graph.items():
-            adjacent_set = set(item.adjacent)
-            if not id_set.intersection(adjacent_set):
+        id_set = id_list if isinstance(id_list, (set, frozenset)) else set(id_list)
+        for item in self.__graph.values():
+            if id_set.isdisjoint(item.adjacent):
                 result.__add_item(item)
 
         return result
 
     @property
     def ids(self):
-        return list(self.__graph.keys())
+        return self.__graph.keys()
 
     def __len__(self):
         return len(self.__graph)
@@ -200,7 +225,8 @@ class Graph:
 
     @classmethod
     def element_get_children_with_tag(cls, element, tag):
-        return [item for item in element if item.tag == str(tag)]
+        tag = str(tag)
+        return [item for item in element if item.tag == tag]
 
     @classmethod
     def element_get_first_child_with_tag(cls, element, tag):
@@ -210,23 +236,7 @@ class Graph:
 
     @classmethod
     def __get_handler_fn(cls, element):
-        tag = Tag.from_element(element)
-
-        try:
-            fn_name = f'handle_{tag.tag}'
-            return globals()[fn_name]
-        except KeyError:
-            return Graph.TAG_HANDLERS.get(tag.tag)
-
-    @classmethod
-    def element_has_attribs(cls, element, attribs):
-        attribs = [element.attrib.get(attrib) for attrib in attribs]
-
-        return all(attribs)
-
-    @classmethod
-    def element_is_subprocess(cls, element):
-        return element.tag == str(Tag('subProcess'))
+        return _HANDLER_BY_CLARK_TAG.get(element.tag)
 
     @classmethod
     def __process_element(cls, element):
@@ -234,37 +244,45 @@ class Graph:
 
         if handler_fn:
             return handler_fn(element)
+
+        attrib = element.attrib
+        if not attrib.get('id'):
+            return None
+        elif attrib.get('sourceRef') and attrib.get('targetRef'):
+            return handle_edge(element)
         else:
-            for handler_fn in Graph.OTHER_HANDLERS:
-                try:
-                    return handler_fn(element)
-                except UnsuitableHandlerException:
-                    pass
+            return handle_node(element)
 
     def get_edges(self, source_id=None, target_id=None):
-        edges = [item for item in self.__graph.values() if isinstance(item, Edge)]
-
-        if source_id:
-            edges = [edge for edge in edges if edge.source_node == source_id]
-
-        if target_id:
-            edges = [edge for edge in edges if edge.target_node == target_id]
-
-        return edges
+        if source_id and target_id:
+            by_source = self.__edges_by_source.get(source_id, ())
+            by_target = self.__edges_by_target.get(target_id, ())
+            if len(by_source) <= len(by_target):
+                return [edge for edge in by_source if edge.target_node == target_id]
+            else:
+                return [edge for edge in by_target if edge.source_node == source_id]
+        elif source_id:
+            return list(self.__edges_by_source.get(source_id, ()))
+        elif target_id:
+            return list(self.__edges_by_target.get(target_id, ()))
+        else:
+            return list(self.__edges)
 
     def get_downstream_nodes(self, node_id):
-        edges = [edge for edge in self.get_edges(source_id=node_id)]
-
-        return [edge.target_node for edge in edges]
+        return [edge.target_node for edge in self.__edges_by_source.get(node_id, ())]
 
 
 class Node:
+    __slots__ = ('id', '__tag', '__name', '__show_id', '__colour', '__colour_text', '__extras')
+    SHAPE = 'box'
+
     def __init__(self, node_id, tag, name, show_id=True, colour=None, extras=None):
         self.id = node_id
         self.__tag = tag
         self.__name = name if name else '<no_name>'
         self.__show_id = show_id
         self.__colour = colour
+        self.__colour_text = f', fillcolor="{colour}", style="filled"' if colour else ''
         self.__extras = extras
 
     @classmethod
@@ -272,17 +290,16 @@ class Node:
         return Node(element.attrib['id'], element.tag, element.attrib.get('name'))
 
     def to_dot(self, graph=None, params=None):
-        colour_text = f', fillcolor="{self.__colour}", style="filled"' if self.__colour else ''
-        return f'{self.id} [label="{self.get_label(params=params)}", shape="{self.get_shape()}"{colour_text}]'
+        return f'{self.id} [label="{self.get_label(params=params)}", shape="{self.SHAPE}"{self.__colour_text}]'
+
+    def write_dot(self, write, graph=None, params=None):
+        write(self.to_dot(graph=graph, params=params))
 
     def get_label(self, params=None, include_extras=True):
         extras_label = '\n' + '\n'.join(
             [f'{item[0]}: {item[1]}' for item in self.__extras.items()]) if self.__extras and include_extras else ''
         return f'{self.__name}\\nid: {self.id}{extras_label}' if self.__show_id else self.__name
 
-    def get_shape(self, params=None):
-        return 'box'
-
     @property
     def start_node_id(self):
         return self.id
@@ -297,21 +314,20 @@ class Node:
 
     @property
     def adjacent(self):
-        return [self.id]
+        return (self.id,)
 
     @property
     def colour(self):
         return self.__colour
 
-    @colour.setter
-    def colour(self, colour):
-        self.__colour = colour
-
     def get_extra(self, extra_name):
         return self.__extras.get(extra_name)
 
 
 class Edge:
+    __slots__ = ('id', '__name', '__source_node', '__target_node', '__condition')
+    __LINE_BREAK_REGEX = re.compile(r'(&&|\|\||==)')
+
     def __init__(self, edge_id, source_node, target_node, name=None, condition=None):
         self.id = edge_id
         self.__name = name
@@ -321,21 +337,15 @@ class Edge:
 
     @classmethod
     def __tidy_condition(cls, condition_text):
-        line_break = ['&&', '||', '==']
         if condition_text.startswith('${'):
             condition_text = condition_text[2:]
         if condition_text.endswith('}'):
             condition_text = condition_text[:-1]
-        result = condition_text.replace('"', '\\"')
-
-        for item in line_break:
-            result = result.replace(item, item + '\\n')
-
-        return result
+        return Edge.__LINE_BREAK_REGEX.sub(r'\1\\n', condition_text.replace('"', '\\"'))
 
     @classmethod
     def __get_condition(cls, element):
-        condition = Graph.element_get_first_child_with_tag(element, Tag('conditionExpression'))
+        condition = Graph.element_get_first_child_with_tag(element, Tag.clark('conditionExpression'))
         return Edge.__tidy_condition(condition.text) if condition is not None else None
 
     @classmethod
@@ -346,14 +356,15 @@ class Edge:
 
     def to_dot(self, graph=None, params=None):
         show_flows = params.get('show_flows') if params else False
+        source_node = self.__source_node
+        target_node = self.__target_node
         if graph:
-            source_node = graph.get(self.__source_node).end_node_id if graph.get(
-                self.__source_node) else self.__source_node
-            target_node = graph.get(self.__target_node).start_node_id if graph.get(
-                self.__target_node) else self.__target_node
-        else:
-            source_node = self.__source_node
-            target_node = self.__target_node
+            source = graph.get(source_node)
+            if source is not None:
+                source_node = source.end_node_id
+            target = graph.get(target_node)
+            if target is not None:
+                target_node = target.start_node_id
 
         label_components = []
 
@@ -373,9 +384,12 @@ class Edge:
 
         return f'{source_node} -> {target_node}{label}'
 
+    def write_dot(self, write, graph=None, params=None):
+        write(self.to_dot(graph=graph, params=params))
+
     @property
     def adjacent(self):
-        return [self.__source_node, self.__target_node]
+        return self.__source_node, self.__target_node
 
     @property
     def source_node(self):
@@ -387,15 +401,17 @@ class Edge:
 
 
 class Subprocess:
+    __slots__ = ('id', '__name', '__children', '__start_node', '__end_node', '__index', '__adjacent')
     __subgraph_index = 0
 
     def __init__(self, id, name, children):
         self.id = id
         self.__name = name
         self.__children = children
-        self.__start_node = self.__children.get_child_nodes_with_tag(str(Tag('startEvent')))[0]
-        self.__end_node = self.__children.get_child_nodes_with_tag(str(Tag('endEvent')))[0]
+        self.__start_node = self.__children.get_child_nodes_with_tag(Tag.clark('startEvent'))[0]
+        self.__end_node = self.__children.get_child_nodes_with_tag(Tag.clark('endEvent'))[0]
         self.__index = Subprocess.__get_subgraph_index()
+        self.__adjacent = (self.id, *self.__children.ids)
 
     @classmethod
     def from_element(cls, element):
@@ -412,13 +428,15 @@ class Subprocess:
         return self.__end_node.id
 
     def to_dot(self, graph=None, params=None):
-        result = [f'subgraph cluster{self.__index} {{', f'label="{self.__name}"']
-        result.append('style="filled"\n')
-        result.append('fillcolor="#f2f2f2"')
-        result.append(self.__children.to_dot(graph=graph, params=params))
-        result.append('}\n')
+        result = []
+        self.write_dot(result.append, graph=graph, params=params)
 
-        return '\n'.join(result)
+        return ''.join(result)
+
+    def write_dot(self, write, graph=None, params=None):
+        write(f'subgraph cluster{self.__index} {{\nlabel="{self.__name}"\nstyle="filled"\n\nfillcolor="#f2f2f2"\n')
+        self.__children.write_dot(write, graph=graph, params=params)
+        write('}\n')
 
     @classmethod
     def __get_subgraph_index(cls):
@@ -428,23 +446,46 @@ class Subprocess:
 
     @property
     def adjacent(self):
-        result = [self.id]
-        result.extend(self.__children.ids)
-        return result
+        return self.__adjacent
 
     @property
     def name(self):
         return self.__name
 
 
+class StartEvent(Node):
+    __slots__ = ()
+
+    def __init__(self, node_id, tag, name):
+        super().__init__(node_id, tag, name, colour='#d1ffd1')
+
+    @classmethod
+    def from_element(cls, element):
+        return StartEvent(element.attrib['id'], element.tag, element.attrib.get('name'))
+
+
+class EndEvent(Node):
+    __slots__ = ()
+
+    def __init__(self, node_id, tag, name):
+        super().__init__(node_id, tag, name, colour='#ffd1d1')
+
+    @classmethod
+    def from_element(cls, element):
+        return EndEvent(element.attrib['id'], element.tag, element.attrib.get('name'))
+
+
 class BoundaryEvent(Node):
+    __slots__ = ('__attached',)
+    SHAPE = 'circle'
+
     def __init__(self, node_id, tag, name, attached):
         super().__init__(node_id, tag, name, show_id=False)
         self.__attached = attached
 
     def to_dot(self, graph=None, params=None):
         edge = Edge('boundary', self.__attached, self.id)
-        return f'{self.id} [shape="circle", label="~"]\n' + edge.to_dot(graph=graph, params=params)
+        return f'{self.id} [shape="{self.SHAPE}", label="~"]\n' + edge.to_dot(graph=graph, params=params)
 
     @classmethod
     def from_element(cls, element):
@@ -452,6 +493,8 @@ class BoundaryEvent(Node):
 
 
 class Gateway(Node):
+    __slots__ = ('__label',)
+    SHAPE = 'diamond'
     __LABELS = {
         'exclusiveGateway': 'X',
         'parallelGateway': '+'
@@ -459,12 +502,10 @@ class Gateway(Node):
 
     def __init__(self, node_id, tag, name):
         super().__init__(node_id, tag, name)
+        self.__label = Gateway.__LABELS.get(Tag.from_string(tag).tag)
 
     def to_dot(self, graph=None, params=None):
-        tag = Tag.from_string(self.tag)
-        label = Gateway.__LABELS.get(tag.tag)
-
-        return f'{self.id} [shape="diamond", label="{label}"]'
+        return f'{self.id} [shape="{self.SHAPE}", label="{self.__label}"]'
 
     @classmethod
     def from_element(self, element):
@@ -473,9 +514,12 @@ class Gateway(Node):
 
 
 class ServiceTask(Node):
+    __slots__ = ('__short_class',)
+
     def __init__(self, node_id, tag, name, java_class):
         extras = {'class': java_class}
         super().__init__(node_id, tag, name, colour='#d1f4ff', extras=extras)
+        self.__short_class = java_class.rpartition('.')[2] if java_class else None
 
     @classmethod
     def from_element(self, element):
@@ -489,7 +533,7 @@ class ServiceTask(Node):
 
         if java_class:
             if not params or not params.get('show_package_names'):
-                java_label = java_class.split('.')[-1]
+                java_label = self.__short_class
             else:
                 java_label = java_class
 
@@ -499,9 +543,12 @@ class ServiceTask(Node):
 
 
 class TaskListener:
+    __slots__ = ('event', 'class_name', 'short_class_name', 'expression')
+
     def __init__(self, event, class_name=None, expression=None):
         self.event = event
         self.class_name = class_name
+        self.short_class_name = class_name.rpartition('.')[2] if class_name else None
         self.expression = expression
 
     @classmethod
@@ -512,6 +559,9 @@ class TaskListener:
 
 
 class UserTask(Node):
+    __slots__ = ('__task_listeners',)
+    SHAPE = 'ellipse'
+
     def __init__(self, node_id, tag, name, task_listeners=None):
         super().__init__(node_id, tag, name, colour='#e8d1ff')
         self.__task_listeners = task_listeners
@@ -519,31 +569,32 @@ class UserTask(Node):
     @classmethod
     def from_element(cls, element):
         task_listeners = [TaskListener.from_element(sub_element) for sub_element in
-                          element.findall('.//{http://activiti.org/bpmn}taskListener')]
+                          _TASK_LISTENER_XPATH(element)]
 
         return UserTask(element.attrib['id'], element.tag, element.attrib['name'], task_listeners)
 
-    def get_shape(self, params=None):
-        return 'ellipse'
-
-    def __get_class_name(self, class_name, params):
-        if not params or not params.get('show_package_names'):
-            return class_name.split('.')[-1]
+    def __get_class_name(self, listener, params):
+        if listener.class_name is None:
+            return listener.expression
+        elif not params or not params.get('show_package_names'):
+            return listener.short_class_name
         else:
-            return class_name
+            return listener.class_name
 
     def get_label(self, params=None):
         label = super().get_label()
-        if not params or params.get('show_task_listeners'):
+        if params and params.get('show_task_listeners') and self.__task_listeners:
             task_listener_text = '\n' + '\n'.join(
-                [f'{listener.event}: {self.__get_class_name(listener.class_name, params=params)}' for listener in
-                 self.__task_listeners]) if self.__task_listeners else ''
+                f'{listener.event}: {self.__get_class_name(listener, params=params)}' for listener in
+                self.__task_listeners)
         else:
             task_listener_text = ''
         return label + task_listener_text
 
 
 class CallActivity(Node):
+    __slots__ = ()
+
     def __init__(self, node_id, tag, name, called_element):
         extras = {'calling': called_element}
         super().__init__(node_id, tag, name, colour='#ffffd1', extras=extras)
@@ -554,6 +605,8 @@ class CallActivity(Node):
 
 
 class IntermediateCatchEvent(Node):
+    __slots__ = ()
+
     def __init__(self, node_id, tag, name, extras=None):
         super().__init__(node_id, tag, name, colour='#ffd1f4', extras=extras)
 
@@ -567,12 +620,26 @@ class IntermediateCatchEvent(Node):
     def __get_extras(cls, element):
         extras = {}
 
-        message_event_definitions = element.findall(f'.//{str(Tag("messageEventDefinition"))}')
-        if message_event_definitions:
-            extras['messageRef'] = message_event_definitions[0].attrib['messageRef']
+        message_event_definition = next(element.iterfind(_MSG_EVT_PATH), None)
+        if message_event_definition is not None:
+            extras['messageRef'] = message_event_definition.attrib['messageRef']
 
-        timer_durations = element.findall(f'.//{str(Tag("timeDuration"))}')
-        if timer_durations:
-            extras['duration'] = timer_durations[0].text
+        timer_duration = next(element.iterfind(_TIMER_PATH), None)
+        if timer_duration is not None:
+            extras['duration'] = timer_duration.text
 
         return extras
+
+
+_HANDLER_BY_CLARK_TAG = {
+    Tag.clark('subProcess'): handle_subProcess,
+    Tag.clark('boundaryEvent'): handle_boundaryEvent,
+    Tag.clark('serviceTask'): handle_serviceTask,
+    Tag.clark('userTask'): handle_userTask,
+    Tag.clark('callActivity'): handle_callActivity,
+    Tag.clark('intermediateCatchEvent'): handle_intermediateCatchEvent,
+    Tag.clark('startEvent'): handle_startEvent,
+    Tag.clark('endEvent'): handle_endEvent,
+    Tag.clark('exclusiveGateway'): handle_gateway,
+    Tag.clark('parallelGateway'): handle_gateway
+}